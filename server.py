@@ -2,9 +2,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from piper import PiperVoice
-import base64
-import io
-import wave
+from piper.config import PiperConfig
+import onnxruntime as ort
+import pybase64
+import json
+import os
+import struct
+from functools import lru_cache
 from typing import Optional
 
 app = FastAPI()
@@ -18,13 +22,117 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Run inference on the GPU when onnxruntime-gpu is installed and a CUDA
+# device is visible; keep the CPU provider as fallback either way.
+if "CUDAExecutionProvider" in ort.get_available_providers():
+    _PROVIDERS = [
+        ("CUDAExecutionProvider", {
+            "device_id": 0,
+            "cudnn_conv_algo_search": "HEURISTIC",
+            "do_copy_in_default_stream": True,
+        }),
+        "CPUExecutionProvider",
+    ]
+else:
+    _PROVIDERS = ["CPUExecutionProvider"]
+
+def _session_options() -> ort.SessionOptions:
+    """
+    One tuned SessionOptions shared by every voice. The ORT defaults spin
+    up one intra-op thread per logical core per session and defer arena
+    allocation to the first request; pinning threads to physical cores,
+    disabling inter-op spinning, and sharing the options (and thus the
+    thread pools) across sessions keeps one voice's worth of threads no
+    matter how many languages are loaded.
+    """
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
+    return opts
+
+_SESSION_OPTS = _session_options()
+
+def _load_voice(model_path: str) -> PiperVoice:
+    """
+    Load a Piper voice on the shared tuned onnxruntime session options.
+    Prefers an int8-quantized sibling (model.int8.onnx, produced by
+    quantize_models.py) when one exists; delete the file to roll back
+    to the FP32 model.
+    """
+    with open(model_path + ".json", encoding="utf-8") as config_file:
+        config = PiperConfig.from_dict(json.load(config_file))
+    int8_path = model_path.replace(".onnx", ".int8.onnx")
+    if os.path.exists(int8_path):
+        model_path = int8_path
+    session = ort.InferenceSession(
+        model_path, sess_options=_SESSION_OPTS, providers=_PROVIDERS
+    )
+    return PiperVoice(config=config, session=session)
+
 # Load voices for different languages
 voices = {
-    "english": PiperVoice.load("language/English/model.onnx"),
-    "hindi": PiperVoice.load("language/Hindi/model.onnx"),
-    "czech": PiperVoice.load("language/Czech/model.onnx")
+    "english": _load_voice("language/English/model.onnx"),
+    "hindi": _load_voice("language/Hindi/model.onnx"),
+    "czech": _load_voice("language/Czech/model.onnx")
 }
 
+# The voice set is fixed at startup, so build the discovery response once
+# instead of re-listing the dict keys on every probe from the frontend
+_LANG_LIST = tuple(voices.keys())
+_LANG_DISCOVERY_RESP = {"languages": list(_LANG_LIST)}
+
+@lru_cache(maxsize=8)
+def _invalid_language_error(language: str) -> dict:
+    """Error payload for an unknown language; cached per bad name"""
+    return {"error": f"Invalid language: {language}. Available: {list(_LANG_LIST)}"}
+
+@app.on_event("startup")
+def warm_up_voices():
+    """Run one inference per voice so ORT's arena is allocated and the
+    graph is optimized before the first real request arrives."""
+    for voice in voices.values():
+        for _ in voice.synthesize("Warm up."):
+            pass
+
+# Audio config (Piper default)
+SAMPLE_RATE = 22050
+CHANNELS = 1
+SAMPLE_WIDTH = 2  # 16-bit
+
+def wav_header(data_len: int) -> bytes:
+    """Build the 44-byte RIFF header for 16-bit PCM of the given length."""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_len, b'WAVE',
+        b'fmt ', 16, 1, CHANNELS, SAMPLE_RATE,
+        SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH,
+        CHANNELS * SAMPLE_WIDTH, 8 * SAMPLE_WIDTH,
+        b'data', data_len
+    )
+
+def pcm_chunks_to_wav_b64(pcm_chunks) -> str:
+    """
+    Base64-encode a WAV built from PCM chunks without ever materializing
+    the WAV itself: the header and each chunk are fed through the encoder
+    incrementally, carrying at most 2 bytes of residue between pieces.
+    Peak memory is the PCM chunks plus the output string, roughly half of
+    the join-then-encode approach.
+    """
+    total = sum(len(chunk) for chunk in pcm_chunks)
+    parts = []
+    carry = b""
+    for piece in (wav_header(total), *pcm_chunks):
+        data = carry + piece if carry else piece
+        cut = len(data) - (len(data) % 3)
+        if cut:
+            parts.append(pybase64.b64encode(data[:cut]).decode("ascii"))
+        carry = data[cut:]
+    if carry:
+        parts.append(pybase64.b64encode(carry).decode("ascii"))
+    return "".join(parts)
+
 class TTSRequest(BaseModel):
     text: str
     language: Optional[str] = None
@@ -32,24 +140,16 @@ class TTSRequest(BaseModel):
 @app.post("/tts")
 def tts(request: TTSRequest):
     if request.language is None:
-        return {"languages": list(voices.keys())}
-    
-    lang = request.language.lower()
-    if lang not in voices:
-        return {"error": f"Invalid language: {request.language}. Available: {list(voices.keys())}"}
-    
-    voice = voices[lang]
-    
-    # Use BytesIO to create WAV in memory
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        voice.synthesize_wav(request.text, wav_file)
-    
-    # Get WAV bytes
-    wav_bytes = wav_buffer.getvalue()
-
-    # Convert to base64 for JSON response
-    audio_base64 = base64.b64encode(wav_bytes).decode("utf-8")
+        return _LANG_DISCOVERY_RESP
+
+    voice = voices.get(request.language.lower())
+    if voice is None:
+        return _invalid_language_error(request.language)
+
+    # Collect raw PCM from the decoder and stream it through the base64
+    # encoder - the full WAV is never held in memory
+    pcm_chunks = [chunk.audio_int16_bytes for chunk in voice.synthesize(request.text)]
+    audio_base64 = pcm_chunks_to_wav_b64(pcm_chunks)
 
     return {"audio_base64": audio_base64}
 
@@ -13,12 +13,25 @@ from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from piper import PiperVoice
-import io
-import wave
+from piper.config import PiperConfig
+from aiortc import RTCPeerConnection, RTCSessionDescription
+from aiortc.mediastreams import MediaStreamTrack
+import av
+import onnxruntime as ort
+import orjson
+import pybase64
+import fractions
+import json
+import logging
+import os
 import struct
+import time
 import asyncio
-from typing import Optional, Generator
-import re
+import concurrent.futures
+from collections import deque
+from typing import AsyncGenerator, Optional
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Streaming TTS API")
 
@@ -31,17 +44,144 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Run inference on the GPU when onnxruntime-gpu is installed and a CUDA
+# device is visible; keep the CPU provider as fallback either way.
+if "CUDAExecutionProvider" in ort.get_available_providers():
+    _PROVIDERS = [
+        ("CUDAExecutionProvider", {
+            "device_id": 0,
+            "cudnn_conv_algo_search": "HEURISTIC",
+            "do_copy_in_default_stream": True,
+        }),
+        "CPUExecutionProvider",
+    ]
+else:
+    _PROVIDERS = ["CPUExecutionProvider"]
+
+def _session_options() -> ort.SessionOptions:
+    """
+    One tuned SessionOptions shared by every voice. The ORT defaults spin
+    up one intra-op thread per logical core per session and defer arena
+    allocation to the first request; pinning threads to physical cores,
+    disabling inter-op spinning, and sharing the options (and thus the
+    thread pools) across sessions keeps one voice's worth of threads no
+    matter how many languages are loaded.
+    """
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.add_session_config_entry("session.inter_op.allow_spinning", "0")
+    return opts
+
+_SESSION_OPTS = _session_options()
+
+def _load_voice(model_path: str) -> PiperVoice:
+    """
+    Load a Piper voice on the shared tuned onnxruntime session options.
+    Prefers an int8-quantized sibling (model.int8.onnx, produced by
+    quantize_models.py) when one exists; delete the file to roll back
+    to the FP32 model.
+    """
+    with open(model_path + ".json", encoding="utf-8") as config_file:
+        config = PiperConfig.from_dict(json.load(config_file))
+    int8_path = model_path.replace(".onnx", ".int8.onnx")
+    if os.path.exists(int8_path):
+        model_path = int8_path
+    session = ort.InferenceSession(
+        model_path, sess_options=_SESSION_OPTS, providers=_PROVIDERS
+    )
+    return PiperVoice(config=config, session=session)
+
 # Load voices
 voices = {
-    "english": PiperVoice.load("English/model.onnx"),
-    "hindi": PiperVoice.load("Hindi/model.onnx")
+    "english": _load_voice("English/model.onnx"),
+    "hindi": _load_voice("Hindi/model.onnx")
 }
 
+def _get_voice(language: Optional[str]) -> Optional[PiperVoice]:
+    """
+    Look up a voice by language, defaulting to English. Skips the lower()
+    allocation when the name is already lowercase (the common case for
+    clients sending the literal "english").
+    """
+    if not language:
+        return voices.get("english")
+    return voices.get(language if language.islower() else language.lower())
+
+@app.on_event("startup")
+def warm_up_voices():
+    """Run one inference per voice so ORT's arena is allocated and the
+    graph is optimized before the first real request arrives."""
+    for voice in voices.values():
+        for _ in voice.synthesize("Warm up."):
+            pass
+
+# Dedicated pool for ONNX inference. Bounded so concurrent requests queue
+# up here instead of oversubscribing the CPU (ORT already parallelizes
+# internally) or exhausting FastAPI's shared default threadpool.
+_TTS_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="piper"
+)
+
 # Audio config (Piper default)
 SAMPLE_RATE = 22050
 CHANNELS = 1
 SAMPLE_WIDTH = 2  # 16-bit
 
+# Words whose trailing period does not end a sentence
+_ABBREV = frozenset({
+    "Dr", "Mr", "Mrs", "Ms", "Sr", "Jr", "St", "Prof", "vs", "etc",
+    "Inc", "Ltd", "U.S", "U.K", "e.g", "i.e",
+})
+
+def _is_sentence_end(buffer: str, punct: int) -> bool:
+    """
+    Decide whether the '.' at `punct` really ends a sentence, or just an
+    abbreviation ("Dr. Smith") or an initial ("J. Doe").
+    """
+    start = punct
+    while start > 0 and (buffer[start - 1].isalnum() or buffer[start - 1] == '.'):
+        start -= 1
+    word = buffer[start:punct]
+    if word in _ABBREV:
+        return False
+    if len(word) == 1 and word.isupper():
+        return False
+    return True
+
+def wav_header(data_len: int) -> bytes:
+    """Build the 44-byte RIFF header for 16-bit PCM of the given length."""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_len, b'WAVE',
+        b'fmt ', 16, 1, CHANNELS, SAMPLE_RATE,
+        SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH,
+        CHANNELS * SAMPLE_WIDTH, 8 * SAMPLE_WIDTH,
+        b'data', data_len
+    )
+
+def pcm_chunks_to_wav_b64(pcm_chunks) -> str:
+    """
+    Base64-encode a WAV built from PCM chunks without ever materializing
+    the WAV itself: the header and each chunk are fed through the encoder
+    incrementally, carrying at most 2 bytes of residue between pieces.
+    Peak memory is the PCM chunks plus the output string, roughly half of
+    the join-then-encode approach.
+    """
+    total = sum(len(chunk) for chunk in pcm_chunks)
+    parts = []
+    carry = b""
+    for piece in (wav_header(total), *pcm_chunks):
+        data = carry + piece if carry else piece
+        cut = len(data) - (len(data) % 3)
+        if cut:
+            parts.append(pybase64.b64encode(data[:cut]).decode("ascii"))
+        carry = data[cut:]
+    if carry:
+        parts.append(pybase64.b64encode(carry).decode("ascii"))
+    return "".join(parts)
+
 class TTSRequest(BaseModel):
     text: str
     language: Optional[str] = "english"
@@ -57,46 +197,39 @@ class ChunkedTTSRequest(BaseModel):
 # Use this for simple integration - Next.js can fetch and stream
 # =============================================================================
 
-def generate_audio_stream(text: str, language: str) -> Generator[bytes, None, None]:
+async def synthesize_chunks(voice: PiperVoice, text: str) -> AsyncGenerator[bytes, None]:
     """
-    Generate audio as raw PCM chunks.
-    This allows the frontend to start playing before synthesis completes.
+    Drive Piper's per-sentence generator and yield raw PCM as it leaves
+    the decoder. Each `next()` on the (blocking) iterator runs on the
+    dedicated inference pool so the event loop stays free while a
+    sentence is synthesized.
     """
-    voice = voices.get(language.lower())
-    if not voice:
-        return
-    
-    # Piper synthesizes to a buffer - we'll stream it in chunks
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        voice.synthesize_wav(text, wav_file)
-    
-    # Skip WAV header (44 bytes) and stream raw PCM
-    wav_buffer.seek(44)
-    
-    # Stream in chunks (4096 bytes = ~93ms of audio at 22050Hz 16-bit mono)
-    chunk_size = 4096
+    loop = asyncio.get_running_loop()
+    chunk_iter = voice.synthesize(text)
     while True:
-        chunk = wav_buffer.read(chunk_size)
-        if not chunk:
+        chunk = await loop.run_in_executor(_TTS_POOL, next, chunk_iter, None)
+        if chunk is None:
             break
-        yield chunk
+        yield chunk.audio_int16_bytes
 
 @app.post("/tts/stream")
 async def tts_stream(request: TTSRequest):
     """
-    Stream audio as raw PCM bytes.
-    
+    Stream audio as raw PCM bytes, sentence by sentence.
+    The first chunk arrives as soon as the first sentence is synthesized,
+    so the frontend can start playing long before synthesis completes.
+
     Frontend should:
     1. Fetch with streaming
     2. Decode PCM (16-bit, 22050Hz, mono)
     3. Push to Web Audio API buffer
     """
-    if request.language.lower() not in voices:
+    voice = _get_voice(request.language)
+    if not voice:
         return {"error": f"Invalid language. Available: {list(voices.keys())}"}
-    
+
     return StreamingResponse(
-        generate_audio_stream(request.text, request.language),
+        synthesize_chunks(voice, request.text),
         media_type="audio/pcm",
         headers={
             "X-Sample-Rate": str(SAMPLE_RATE),
@@ -113,45 +246,101 @@ async def tts_stream(request: TTSRequest):
 class TextChunkBuffer:
     """
     Intelligent text buffering for LLM streaming.
-    Collects tokens until a natural break point for TTS.
+    Collects tokens until a natural break point for TTS, ignoring
+    periods that belong to abbreviations like "Dr." or "e.g.".
     """
     def __init__(self):
-        self.buffer = ""
+        # Tokens are collected in a deque and joined lazily: appending per
+        # token is O(token), while `buffer += text` re-copies the whole
+        # buffer once the regex scan holds extra references to it
+        self._parts: deque = deque()
+        self._len = 0
         self.min_chars = 20  # Minimum characters before TTS
-        
+        self.max_chars = 200  # Hard cap - force a flush past this point
+        self.scan_start = 0  # Only re-scan the new tail, not the whole buffer
+        self._clause_end: Optional[int] = None  # Earliest clause boundary seen
+        self._first_token_time: Optional[float] = None
+
     def add(self, text: str) -> Optional[str]:
         """Add text, return chunk if ready for TTS"""
-        self.buffer += text
-        
-        # Check for sentence boundaries
-        sentence_ends = re.finditer(r'[.!?]\s+', self.buffer)
+        if self._first_token_time is None:
+            self._first_token_time = time.monotonic()
+        self._parts.append(text)
+        self._len += len(text)
+
+        # Too short to emit anything - don't even materialize the buffer
+        if self._len < self.min_chars:
+            return None
+
+        buffer = "".join(self._parts)
+        n = len(buffer)
+
+        # One pass over the unscanned tail: keep the last real sentence
+        # boundary and remember the earliest clause boundary as a fallback
+        # for when the buffer is getting long
         last_end = None
-        for match in sentence_ends:
-            if match.end() >= self.min_chars:
-                last_end = match.end()
-        
-        # Also check for clause boundaries if buffer is getting long
-        if last_end is None and len(self.buffer) > 50:
-            clause_ends = re.finditer(r'[,;:]\s+', self.buffer)
-            for match in clause_ends:
-                if match.end() >= self.min_chars:
-                    last_end = match.end()
-                    break
-        
+        for i in range(self.scan_start, n - 1):
+            ch = buffer[i]
+            if not buffer[i + 1].isspace():
+                continue
+            if ch in '.!?':
+                end = i + 2
+                while end < n and buffer[end].isspace():
+                    end += 1
+                if end >= self.min_chars and (ch != '.' or _is_sentence_end(buffer, i)):
+                    last_end = end
+            elif ch in ',;:' and self._clause_end is None and i + 2 >= self.min_chars:
+                self._clause_end = i + 2
+
+        if last_end is None and n > 50:
+            last_end = self._clause_end
+
+        # Hard cap: long punctuation-free runs (lists, code, some scripts)
+        # must not stall synthesis or grow the buffer without bound, so
+        # force a break at the last whitespace before the cap
+        if last_end is None and n > self.max_chars:
+            last_end = buffer.rfind(' ', self.min_chars, self.max_chars)
+            if last_end == -1:
+                last_end = self.max_chars
+
         if last_end:
-            chunk = self.buffer[:last_end].strip()
-            self.buffer = self.buffer[last_end:]
+            chunk = buffer[:last_end].strip()
+            self._log_emit(chunk)
+            self._set_buffer(buffer[last_end:])
             return chunk
-        
+
+        # No boundary yet - keep the joined buffer as a single part and
+        # leave 2 chars of overlap: a boundary needs punctuation + whitespace,
+        # and the punctuation may already be waiting for its space
+        self._parts.clear()
+        self._parts.append(buffer)
+        self.scan_start = max(0, self._len - 2)
         return None
-    
+
     def flush(self) -> Optional[str]:
         """Get remaining text"""
-        if self.buffer.strip():
-            result = self.buffer.strip()
-            self.buffer = ""
-            return result
-        return None
+        result = "".join(self._parts).strip()
+        if result:
+            self._log_emit(result)
+        self._set_buffer("")
+        return result or None
+
+    def _set_buffer(self, tail: str):
+        """Reset the buffer to hold only `tail` and restart scanning"""
+        self._parts.clear()
+        if tail:
+            self._parts.append(tail)
+        self._len = len(tail)
+        self.scan_start = 0
+        self._clause_end = None
+        self._first_token_time = time.monotonic() if tail else None
+
+    def _log_emit(self, chunk: str):
+        """Record how long the emitted chunk sat aggregating in the buffer"""
+        if self._first_token_time is not None:
+            elapsed_ms = (time.monotonic() - self._first_token_time) * 1000
+            logger.debug("chunk emitted: %d chars after %.1f ms of aggregation",
+                         len(chunk), elapsed_ms)
 
 @app.websocket("/ws/tts")
 async def websocket_tts(websocket: WebSocket):
@@ -173,8 +362,10 @@ async def websocket_tts(websocket: WebSocket):
     
     try:
         while True:
-            # Receive text chunk from client (from LLM stream)
-            data = await websocket.receive_json()
+            # Receive text chunk from client (from LLM stream).
+            # receive_json would route through stdlib json; orjson parses
+            # the small per-token frames several times faster.
+            data = orjson.loads(await websocket.receive_text())
             
             text = data.get("text", "")
             language = data.get("language", language)
@@ -200,34 +391,79 @@ async def websocket_tts(websocket: WebSocket):
     except Exception as e:
         await websocket.close(code=1011, reason=str(e))
 
-async def synthesize_and_stream(websocket: WebSocket, text: str, language: str):
+async def synthesize_and_stream(websocket: WebSocket, text: str, language: str,
+                                audio_tag: bytes = b""):
     """Synthesize text and stream audio chunks over WebSocket"""
-    voice = voices.get(language.lower())
+    voice = _get_voice(language)
     if not voice:
         return
-    
-    # Synthesize
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        voice.synthesize_wav(text, wav_file)
-    
-    # Skip WAV header, stream PCM chunks
-    wav_buffer.seek(44)
-    chunk_size = 4096
-    
-    while True:
-        chunk = wav_buffer.read(chunk_size)
-        if not chunk:
-            break
-        await websocket.send_bytes(chunk)
-        # Small delay to prevent overwhelming the client
-        await asyncio.sleep(0.01)
+
+    # Stream each PCM chunk as soon as it leaves the decoder.
+    # No artificial pacing: send_bytes awaits the transport when the
+    # client's receive buffer is full, which is the real flow control.
+    async for chunk in synthesize_chunks(voice, text):
+        await websocket.send_bytes(audio_tag + chunk)
+
+# Frame tags for the binary WebSocket protocol
+_TAG_TEXT = 0x01   # client -> server: UTF-8 text chunk
+_TAG_FINAL = 0x02  # client -> server: final UTF-8 text chunk (may be empty)
+_TAG_AUDIO = b"\x10"  # server -> client: raw PCM audio
+
+@app.websocket("/ws/tts/binary")
+async def websocket_tts_binary(websocket: WebSocket):
+    """
+    Binary-framed variant of /ws/tts - no JSON parsing on the hot path,
+    which matters when every LLM token arrives as its own frame.
+
+    Protocol (first byte of every frame is a tag):
+    - Client sends: 0x01 + UTF-8 text (stream chunk)
+    - Client sends: 0x02 + UTF-8 text (final chunk, text may be empty)
+    - Server sends: 0x10 + raw PCM audio
+
+    The language is fixed per connection with the ?language= query
+    parameter (default "english").
+    """
+    await websocket.accept()
+
+    buffer = TextChunkBuffer()
+    language = websocket.query_params.get("language", "english")
+
+    try:
+        while True:
+            message = await websocket.receive_bytes()
+            if not message:
+                continue
+
+            tag = message[0]
+            text = message[1:].decode("utf-8")
+
+            chunk_to_speak = buffer.add(text)
+            if chunk_to_speak:
+                await synthesize_and_stream(websocket, chunk_to_speak, language,
+                                            audio_tag=_TAG_AUDIO)
+
+            if tag == _TAG_FINAL:
+                remaining = buffer.flush()
+                if remaining:
+                    await synthesize_and_stream(websocket, remaining, language,
+                                                audio_tag=_TAG_AUDIO)
+                await websocket.close()
+                break
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        await websocket.close(code=1011, reason=str(e))
 
 # =============================================================================
 # OPTION 3: Server-Sent Events (SSE) for simpler streaming
 # Good middle ground between HTTP and WebSocket
 # =============================================================================
 
+def _sse_event(payload: dict) -> bytes:
+    """Serialize one SSE data frame (orjson emits bytes directly)."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
 @app.post("/tts/sse")
 async def tts_sse(request: TTSRequest):
     """
@@ -235,39 +471,24 @@ async def tts_sse(request: TTSRequest):
     Each event contains a base64-encoded audio chunk.
     Easier to consume in Next.js than raw streaming.
     """
-    import base64
-    
     async def event_generator():
-        voice = voices.get(request.language.lower())
+        voice = _get_voice(request.language)
         if not voice:
-            yield f"data: {{'error': 'Invalid language'}}\n\n"
+            yield _sse_event({"error": "Invalid language"})
             return
-        
+
         # Send audio config first
-        yield f"data: {{\"type\": \"config\", \"sampleRate\": {SAMPLE_RATE}, \"channels\": {CHANNELS}}}\n\n"
-        
-        # Synthesize
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            voice.synthesize_wav(request.text, wav_file)
-        
-        # Stream chunks
-        wav_buffer.seek(44)
-        chunk_size = 4096
+        yield _sse_event({"type": "config", "sampleRate": SAMPLE_RATE, "channels": CHANNELS})
+
+        # Stream PCM chunks as Piper produces them, sentence by sentence
         chunk_num = 0
-        
-        while True:
-            chunk = wav_buffer.read(chunk_size)
-            if not chunk:
-                break
-            
+        async for chunk in synthesize_chunks(voice, request.text):
             # Base64 encode for SSE (yes, overhead, but easier to parse)
-            b64_chunk = base64.b64encode(chunk).decode('utf-8')
-            yield f"data: {{\"type\": \"audio\", \"chunk\": \"{b64_chunk}\", \"index\": {chunk_num}}}\n\n"
+            b64_chunk = pybase64.b64encode(chunk).decode('ascii')
+            yield _sse_event({"type": "audio", "chunk": b64_chunk, "index": chunk_num})
             chunk_num += 1
-            await asyncio.sleep(0.01)
-        
-        yield f"data: {{\"type\": \"done\"}}\n\n"
+
+        yield _sse_event({"type": "done"})
     
     return StreamingResponse(
         event_generator(),
@@ -278,31 +499,133 @@ async def tts_sse(request: TTSRequest):
         }
     )
 
+# =============================================================================
+# OPTION 4: WebRTC audio track
+# Lowest latency: UDP transport + the browser's native jitter buffer.
+# /tts/stream stays available as the fallback for clients without RTC.
+# =============================================================================
+
+_FRAME_SAMPLES = SAMPLE_RATE // 50  # 20 ms per frame
+_FRAME_BYTES = _FRAME_SAMPLES * SAMPLE_WIDTH
+_FRAME_TIME_BASE = fractions.Fraction(1, SAMPLE_RATE)
+
+class PiperAudioTrack(MediaStreamTrack):
+    """
+    Outgoing audio track fed by Piper. Emits 20ms PCM frames at the
+    native sample rate (aiortc resamples to 48kHz Opus itself) and pads
+    with silence whenever synthesis is behind the audio clock.
+    """
+    kind = "audio"
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._start: Optional[float] = None
+        self._samples = 0
+
+    async def feed(self, voice: PiperVoice, text: str):
+        """Queue synthesized PCM for playout."""
+        async for chunk in synthesize_chunks(voice, text):
+            self._queue.put_nowait(chunk)
+
+    async def recv(self) -> av.AudioFrame:
+        # Pace frames against the wall clock so silence padding
+        # doesn't outrun real time
+        if self._start is None:
+            self._start = time.monotonic()
+        else:
+            delay = self._start + self._samples / SAMPLE_RATE - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        while len(self._buffer) < _FRAME_BYTES and not self._queue.empty():
+            self._buffer.extend(self._queue.get_nowait())
+
+        if len(self._buffer) >= _FRAME_BYTES:
+            data = bytes(self._buffer[:_FRAME_BYTES])
+            del self._buffer[:_FRAME_BYTES]
+        else:
+            data = bytes(_FRAME_BYTES)  # silence
+
+        frame = av.AudioFrame(format="s16", layout="mono", samples=_FRAME_SAMPLES)
+        frame.planes[0].update(data)
+        frame.sample_rate = SAMPLE_RATE
+        frame.pts = self._samples
+        frame.time_base = _FRAME_TIME_BASE
+        self._samples += _FRAME_SAMPLES
+        return frame
+
+class RTCOfferRequest(BaseModel):
+    """SDP offer plus the text to speak over the resulting track"""
+    sdp: str
+    type: str
+    text: str
+    language: Optional[str] = "english"
+
+_peer_connections: set = set()
+
+@app.post("/rtc/offer")
+async def rtc_offer(offer: RTCOfferRequest):
+    """
+    Negotiate a WebRTC session that speaks the given text.
+
+    Client side:
+    1. Create an RTCPeerConnection with a recvonly audio transceiver
+    2. POST the local offer SDP here along with the text
+    3. Apply the returned answer; audio arrives via ontrack
+    """
+    voice = _get_voice(offer.language)
+    if not voice:
+        return {"error": f"Invalid language. Available: {list(voices.keys())}"}
+
+    pc = RTCPeerConnection()
+    _peer_connections.add(pc)
+
+    @pc.on("connectionstatechange")
+    async def on_connectionstatechange():
+        if pc.connectionState in ("failed", "closed"):
+            await pc.close()
+            _peer_connections.discard(pc)
+
+    track = PiperAudioTrack()
+    pc.addTrack(track)
+
+    await pc.setRemoteDescription(RTCSessionDescription(sdp=offer.sdp, type=offer.type))
+    answer = await pc.createAnswer()
+    await pc.setLocalDescription(answer)
+
+    asyncio.ensure_future(track.feed(voice, offer.text))
+
+    return {"sdp": pc.localDescription.sdp, "type": pc.localDescription.type}
+
+@app.on_event("shutdown")
+async def close_peer_connections():
+    await asyncio.gather(*(pc.close() for pc in _peer_connections))
+    _peer_connections.clear()
+
 # =============================================================================
 # Keep original endpoint for backward compatibility
 # =============================================================================
 
 @app.post("/tts")
-def tts_original(request: TTSRequest):
+async def tts_original(request: TTSRequest):
     """Original endpoint - kept for compatibility"""
-    import base64
-    
     if request.language is None:
         return {"languages": list(voices.keys())}
-    
-    lang = request.language.lower()
-    if lang not in voices:
+
+    voice = _get_voice(request.language)
+    if not voice:
         return {"error": f"Invalid language. Available: {list(voices.keys())}"}
-    
-    voice = voices[lang]
-    
-    wav_buffer = io.BytesIO()
-    with wave.open(wav_buffer, 'wb') as wav_file:
-        voice.synthesize_wav(request.text, wav_file)
-    
-    wav_bytes = wav_buffer.getvalue()
-    audio_base64 = base64.b64encode(wav_bytes).decode("utf-8")
-    
+
+    # Run synthesis through the shared async pipeline so it queues on the
+    # inference pool with the streaming endpoints instead of grabbing a
+    # thread from FastAPI's default sync-handler pool
+    pcm_parts = []
+    async for chunk in synthesize_chunks(voice, request.text):
+        pcm_parts.append(chunk)
+    audio_base64 = pcm_chunks_to_wav_b64(pcm_parts)
+
     return {"audio_base64": audio_base64}
 
 @app.get("/")
@@ -313,7 +636,9 @@ def root():
             "/tts": "Original base64 response",
             "/tts/stream": "Streaming PCM response",
             "/tts/sse": "Server-Sent Events streaming",
-            "/ws/tts": "WebSocket for real-time LLM→TTS"
+            "/ws/tts": "WebSocket for real-time LLM→TTS",
+            "/ws/tts/binary": "Binary-framed WebSocket (no JSON parsing)",
+            "/rtc/offer": "WebRTC audio track (lowest latency)"
         },
         "audio_config": {
             "sample_rate": SAMPLE_RATE,
@@ -325,4 +650,16 @@ def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools (from uvicorn[standard]) over the pure-Python
+    # defaults: markedly higher throughput on these streaming endpoints.
+    # Keep workers=1 - each worker would load its own copy of the ONNX
+    # voices, so scale with separate processes behind a balancer instead.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        workers=1,
+    )